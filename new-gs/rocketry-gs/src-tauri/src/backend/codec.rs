@@ -63,9 +63,8 @@ pub fn decode_to_raw_text(topic: &str, payload: &[u8]) -> (String, Option<Value>
         };
     }
 
-    let text = String::from_utf8_lossy(payload).into_owned();
-    let json_value = serde_json::from_str::<Value>(&text).ok();
-    (text, json_value)
+    let json_value = serde_json::from_slice::<Value>(payload).ok();
+    (String::from_utf8_lossy(payload).into_owned(), json_value)
 }
 
 pub fn encode_command_payload(topic: &str, payload: &str) -> Vec<u8> {
@@ -613,5 +612,11 @@ fn flight_state_name(value: i32) -> &'static str {
 }
 
 fn hex(bytes: &[u8]) -> String {
-    bytes.iter().map(|byte| format!("{byte:02X}")).collect()
+    const DIGITS: &[u8; 16] = b"0123456789ABCDEF";
+    let mut out = String::with_capacity(bytes.len() * 2);
+    for &byte in bytes {
+        out.push(DIGITS[(byte >> 4) as usize] as char);
+        out.push(DIGITS[(byte & 0x0F) as usize] as char);
+    }
+    out
 }
@@ -33,7 +33,7 @@ pub struct SerialPortInfo {
 pub struct GpsStatus {
     pub connected: bool,
     pub port: Option<String>,
-    pub fix: String,
+    pub fix: &'static str,
     pub satellites: u8,
     pub lat: Option<f64>,
     pub lon: Option<f64>,
@@ -227,7 +227,7 @@ fn read_loop(
     let mut status = GpsStatus {
         connected: true,
         port: Some(port_label.clone()),
-        fix: "no-fix".to_string(),
+        fix: "no-fix",
         ..Default::default()
     };
     emit_status(&app, &status);
@@ -274,7 +274,7 @@ fn read_loop(
                 let valid = matches!(fix, GnssFixType::Fix2D | GnssFixType::Fix3D)
                     && (pvt.flags().bits() & 0x01) != 0;
 
-                status.fix = fix_label(fix).to_string();
+                status.fix = fix_label(fix);
                 status.satellites = pvt.num_satellites();
 
                 if valid {
@@ -4,11 +4,27 @@ use serde_json::Value;
 use std::fs::{metadata, File, OpenOptions};
 use std::io::{BufWriter, Write};
 use std::path::Path;
-use std::sync::{Arc, Mutex};
+use std::sync::{mpsc, Arc, Mutex};
+use std::thread;
+use std::time::Duration;
+
+const CSV_BUFFER_BYTES: usize = 64 * 1024;
+const CSV_FLUSH_INTERVAL: Duration = Duration::from_secs(1);
+const PACKET_LOG_BATCH: usize = 256;
+const PACKET_LOG_QUEUE: usize = 4 * PACKET_LOG_BATCH;
+
+struct PacketRow {
+    ts_ms: i64,
+    direction: &'static str,
+    topic: String,
+    payload: Vec<u8>,
+    decoded_text: Option<String>,
+}
 
 #[derive(Clone)]
 pub struct PacketLogger {
-    conn: Arc<Mutex<Connection>>,
+    tx: Arc<Mutex<Option<mpsc::SyncSender<PacketRow>>>>,
+    writer: Arc<Mutex<Option<thread::JoinHandle<()>>>>,
 }
 
 impl PacketLogger {
@@ -35,27 +51,101 @@ impl PacketLogger {
             ",
         )?;
 
+        // SQLite inserts run on their own thread so a slow disk only stalls
+        // the MQTT event loop once the bounded queue fills. Rows queued while
+        // a batch is being written are committed together in the next
+        // transaction.
+        let (tx, rx) = mpsc::sync_channel::<PacketRow>(PACKET_LOG_QUEUE);
+        let writer = thread::Builder::new()
+            .name("packet-log-writer".into())
+            .spawn(move || run_packet_writer(conn, rx))?;
+
         Ok(Self {
-            conn: Arc::new(Mutex::new(conn)),
+            tx: Arc::new(Mutex::new(Some(tx))),
+            writer: Arc::new(Mutex::new(Some(writer))),
         })
     }
 
+    /// Close the queue and wait for the writer to commit every pending row.
+    pub fn shutdown(&self) {
+        self.tx.lock().expect("packet log").take();
+        if let Some(writer) = self.writer.lock().expect("packet log writer").take() {
+            if writer.join().is_err() {
+                eprintln!("[packet-log] writer thread panicked");
+            }
+        }
+    }
+
     pub fn log_packet(
         &self,
-        direction: &str,
+        direction: &'static str,
         topic: &str,
         payload: &[u8],
         decoded_text: Option<&str>,
     ) {
-        let result = self.conn.lock().expect("packet logger").execute(
+        let row = PacketRow {
+            ts_ms: now_ms(),
+            direction,
+            topic: topic.to_string(),
+            payload: payload.to_vec(),
+            decoded_text: decoded_text.map(str::to_string),
+        };
+        let tx = self.tx.lock().expect("packet log");
+        let sent = match tx.as_ref() {
+            Some(tx) => tx.send(row).is_ok(),
+            None => false,
+        };
+        if !sent {
+            eprintln!("[packet-log] writer stopped; dropped {direction} {topic}");
+        }
+    }
+}
+
+fn run_packet_writer(mut conn: Connection, rx: mpsc::Receiver<PacketRow>) {
+    let mut batch = Vec::with_capacity(PACKET_LOG_BATCH);
+    while let Ok(row) = rx.recv() {
+        batch.push(row);
+        while batch.len() < PACKET_LOG_BATCH {
+            match rx.try_recv() {
+                Ok(row) => batch.push(row),
+                Err(_) => break,
+            }
+        }
+        if let Err(error) = insert_packets(&mut conn, &batch) {
+            eprintln!(
+                "[packet-log] commit of {} rows failed: {error}",
+                batch.len()
+            );
+        }
+        batch.clear();
+    }
+}
+
+fn insert_packets(conn: &mut Connection, rows: &[PacketRow]) -> rusqlite::Result<()> {
+    let tx = conn.transaction()?;
+    {
+        let mut stmt = tx.prepare_cached(
             "INSERT INTO packet_log (ts_ms, direction, topic, payload, decoded_text)
              VALUES (?, ?, ?, ?, ?)",
-            params![now_ms(), direction, topic, payload, decoded_text],
-        );
-        if let Err(error) = result {
-            eprintln!("[packet-log] {direction} {topic}: {error}");
+        )?;
+        // A bad row is reported and skipped so it cannot roll back the rest
+        // of the batch.
+        for row in rows {
+            if let Err(error) = stmt.execute(params![
+                row.ts_ms,
+                row.direction,
+                row.topic,
+                row.payload,
+                row.decoded_text
+            ]) {
+                eprintln!(
+                    "[packet-log] insert failed for {} {}: {error}",
+                    row.direction, row.topic
+                );
+            }
         }
     }
+    tx.commit()
 }
 
 #[derive(Clone)]
@@ -76,11 +166,13 @@ impl DiagnosticCsv {
         let row = DiagnosticRow::from_event(event, direction, topic, payload, &snapshot);
         let mut writer = self.writer.lock().expect("diagnostic csv");
 
-        if let Err(error) = writeln!(writer, "{}", row.to_csv()) {
+        if let Err(error) = row.write_csv(&mut *writer) {
             eprintln!("[diagnostic-csv] write failed: {error}");
-            return;
         }
-        if let Err(error) = writer.flush() {
+    }
+
+    pub fn flush(&self) {
+        if let Err(error) = self.writer.lock().expect("diagnostic csv").flush() {
             eprintln!("[diagnostic-csv] flush failed: {error}");
         }
     }
@@ -94,16 +186,31 @@ pub fn start_diagnostic_csv(path: &Path) -> Result<DiagnosticCsv, std::io::Error
     let path = path.to_path_buf();
     let needs_header = metadata(&path).map(|m| m.len() == 0).unwrap_or(true);
     let file = OpenOptions::new().create(true).append(true).open(&path)?;
-    let mut writer = BufWriter::new(file);
+    let mut writer = BufWriter::with_capacity(CSV_BUFFER_BYTES, file);
 
     if needs_header {
         writeln!(writer, "{}", DiagnosticRow::header())?;
         writer.flush()?;
     }
 
-    Ok(DiagnosticCsv {
-        writer: Arc::new(Mutex::new(writer)),
-    })
+    // Rows are buffered and flushed once a second (and on exit) rather than
+    // per MQTT message. The flusher holds a weak handle so it winds down once
+    // the last DiagnosticCsv clone is dropped.
+    let writer = Arc::new(Mutex::new(writer));
+    let flush_writer = Arc::downgrade(&writer);
+    thread::Builder::new()
+        .name("diagnostic-csv-flush".into())
+        .spawn(move || loop {
+            thread::sleep(CSV_FLUSH_INTERVAL);
+            let Some(writer) = flush_writer.upgrade() else {
+                break;
+            };
+            if let Err(error) = writer.lock().expect("diagnostic csv").flush() {
+                eprintln!("[diagnostic-csv] flush failed: {error}");
+            }
+        })?;
+
+    Ok(DiagnosticCsv { writer })
 }
 
 struct DiagnosticRow {
@@ -200,44 +307,43 @@ impl DiagnosticRow {
         }
     }
 
-    fn to_csv(&self) -> String {
-        [
-            self.ts_ms.to_string(),
-            csv_escape(&self.event),
-            csv_escape(&self.direction),
-            csv_escape(&self.topic),
-            csv_escape(&self.payload),
-            self.connected.to_string(),
-            self.raw_count.to_string(),
-            csv_escape(&self.last_topic),
-            csv_escape(&self.last_payload),
-            opt_num(self.actual_az),
-            opt_num(self.actual_el),
-            opt_num(self.target_az),
-            opt_num(self.target_el),
-            opt_num(self.actual_az_mech),
-            opt_num(self.target_az_mech),
-            opt_bool(self.az_moving),
-            opt_bool(self.zen_moving),
-            opt_bool(self.az_faulted),
-            opt_bool(self.zen_faulted),
-            opt_num(self.imu_roll),
-            opt_num(self.imu_pitch),
-            opt_num(self.imu_yaw),
-            opt_num(self.imu_yaw360),
-            opt_num(self.yaw_frame_yaw360),
-            opt_num(self.bar_rel_pitch),
-            csv_escape(&self.q),
-            csv_escape(&self.bar_q),
-            csv_escape(&self.yaw_q),
-            csv_escape(&self.bar_rel_q),
-            opt_bool(self.imu_valid),
-            opt_bool(self.imu_startup),
-            opt_num(self.rocket_lat),
-            opt_num(self.rocket_lon),
-            opt_num(self.rocket_alt_m),
-        ]
-        .join(",")
+    // Streams the row straight into the CSV writer. Each field is formatted
+    // in place rather than collected into per-field Strings and joined.
+    fn write_csv(&self, out: &mut impl Write) -> std::io::Result<()> {
+        write!(out, "{}", self.ts_ms)?;
+        csv_str(out, &self.event)?;
+        csv_str(out, &self.direction)?;
+        csv_str(out, &self.topic)?;
+        csv_str(out, &self.payload)?;
+        write!(out, ",{},{}", self.connected, self.raw_count)?;
+        csv_str(out, &self.last_topic)?;
+        csv_str(out, &self.last_payload)?;
+        csv_num(out, self.actual_az)?;
+        csv_num(out, self.actual_el)?;
+        csv_num(out, self.target_az)?;
+        csv_num(out, self.target_el)?;
+        csv_num(out, self.actual_az_mech)?;
+        csv_num(out, self.target_az_mech)?;
+        csv_bool(out, self.az_moving)?;
+        csv_bool(out, self.zen_moving)?;
+        csv_bool(out, self.az_faulted)?;
+        csv_bool(out, self.zen_faulted)?;
+        csv_num(out, self.imu_roll)?;
+        csv_num(out, self.imu_pitch)?;
+        csv_num(out, self.imu_yaw)?;
+        csv_num(out, self.imu_yaw360)?;
+        csv_num(out, self.yaw_frame_yaw360)?;
+        csv_num(out, self.bar_rel_pitch)?;
+        csv_str(out, &self.q)?;
+        csv_str(out, &self.bar_q)?;
+        csv_str(out, &self.yaw_q)?;
+        csv_str(out, &self.bar_rel_q)?;
+        csv_bool(out, self.imu_valid)?;
+        csv_bool(out, self.imu_startup)?;
+        csv_num(out, self.rocket_lat)?;
+        csv_num(out, self.rocket_lon)?;
+        csv_num(out, self.rocket_alt_m)?;
+        writeln!(out)
     }
 }
 
@@ -261,12 +367,18 @@ fn array_string(value: Option<&Value>, key: &str) -> String {
         .join(";")
 }
 
-fn opt_num(value: Option<f64>) -> String {
-    value.map(|v| format!("{v:.6}")).unwrap_or_default()
+fn csv_num(out: &mut impl Write, value: Option<f64>) -> std::io::Result<()> {
+    match value {
+        Some(v) => write!(out, ",{v:.6}"),
+        None => out.write_all(b","),
+    }
 }
 
-fn opt_bool(value: Option<bool>) -> String {
-    value.map(|v| v.to_string()).unwrap_or_default()
+fn csv_bool(out: &mut impl Write, value: Option<bool>) -> std::io::Result<()> {
+    match value {
+        Some(v) => write!(out, ",{v}"),
+        None => out.write_all(b","),
+    }
 }
 
 fn truncate(value: &str, max_chars: usize) -> String {
@@ -276,10 +388,10 @@ fn truncate(value: &str, max_chars: usize) -> String {
     value.chars().take(max_chars).collect()
 }
 
-fn csv_escape(value: &str) -> String {
+fn csv_str(out: &mut impl Write, value: &str) -> std::io::Result<()> {
     if value.contains(',') || value.contains('"') || value.contains('\n') || value.contains('\r') {
-        format!("\"{}\"", value.replace('"', "\"\""))
+        write!(out, ",\"{}\"", value.replace('"', "\"\""))
     } else {
-        value.to_string()
+        write!(out, ",{value}")
     }
 }
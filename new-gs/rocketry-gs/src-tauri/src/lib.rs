@@ -4,7 +4,7 @@ use backend::{
     broker::Broker,
     commands,
     gps::GpsManager,
-    logger::{start_diagnostic_csv, PacketLogger},
+    logger::{start_diagnostic_csv, DiagnosticCsv, PacketLogger},
     mqtt,
     telemetry::TelemetryState,
     tile_cache::TileCache,
@@ -99,6 +99,8 @@ pub fn run() {
                 app.state::<GpsManager>().disconnect(app);
                 app.state::<Broker>().stop();
                 app.state::<TileCache>().stop();
+                app.state::<DiagnosticCsv>().flush();
+                app.state::<PacketLogger>().shutdown();
             }
         });
 }
@@ -66,12 +66,17 @@ const DEBUG_TABS: Array<{ id: DebugTab; label: string; section: string }> = [
 ];
 
 // -- Starlink tab component ---------------------------------------------------
+// Poll the dish proxy quickly while it answers; back off when it is
+// unreachable so a missing dish doesn't keep the UI thread waking every 3 s.
+const STARLINK_POLL_FAST_MS = 3000;
+const STARLINK_POLL_SLOW_MS = 15000;
+
 function StarlinkTab() {
   const [data, setData]       = useState<StarlinkData | null>(null);
   const [loading, setLoading] = useState(false);
   const [fetchErr, setFetchErr] = useState<string | null>(null);
 
-  const poll = useCallback(async () => {
+  const poll = useCallback(async (): Promise<boolean> => {
     setLoading(true);
     try {
       const res = await fetch(STARLINK_PROXY_URL);
@@ -82,17 +87,27 @@ function StarlinkTab() {
         : decodeStarlinkProxyStatus(new Uint8Array(await res.arrayBuffer()));
       setData(data as unknown as StarlinkData);
       setFetchErr(null);
+      return true;
     } catch (e: unknown) {
       setFetchErr(e instanceof Error ? e.message : String(e));
+      return false;
     } finally {
       setLoading(false);
     }
   }, []);
 
   useEffect(() => {
-    poll();
-    const id = setInterval(poll, 3000);
-    return () => clearInterval(id);
+    let cancelled = false;
+    let id: ReturnType<typeof setTimeout> | undefined;
+    const tick = async () => {
+      const ok = await poll();
+      if (!cancelled) id = setTimeout(tick, ok ? STARLINK_POLL_FAST_MS : STARLINK_POLL_SLOW_MS);
+    };
+    tick();
+    return () => {
+      cancelled = true;
+      clearTimeout(id);
+    };
   }, [poll]);
 
   function fmt(v: number | null | undefined, decimals = 1, unit = ''): string {
@@ -253,6 +268,21 @@ function fmtSeen(ts: number | null): string {
   return `${(age / 1000).toFixed(1)}s ago`;
 }
 
+// Every visible log line is re-stamped whenever the panel re-renders. Lines
+// arrive in order, so neighbours usually share a second: rebuild the
+// HH:MM:SS prefix only when the second changes and append the millis.
+let tsCacheSec = -1;
+let tsCachePrefix = '';
+
+function formatTs(ts: number): string {
+  const sec = Math.floor(ts / 1000);
+  if (sec !== tsCacheSec) {
+    tsCacheSec = sec;
+    tsCachePrefix = new Date(sec * 1000).toISOString().slice(11, 19);
+  }
+  return `${tsCachePrefix}.${String(ts - sec * 1000).padStart(3, '0')}`; // HH:MM:SS.mmm
+}
+
 const SENSOR_WINDOW_OPTIONS = [5, 10, 30, 60] as const;
 
 function filterSensorWindow<T extends { timestamp: number }>(samples: T[], seconds: number): T[] {
@@ -1161,10 +1191,6 @@ export function DebugPanel({ mqtt }: Props) {
     ahrs: displayAhrsHistory.length,
   };
 
-  function formatTs(ts: number): string {
-    return new Date(ts).toISOString().slice(11, 23); // HH:MM:SS.mmm
-  }
-
   useEffect(() => {
     if (!absAzEdited && magneticAz != null) {
       setAbsAz(magneticAz.toFixed(1));
@@ -40,10 +40,16 @@ export function GpsTab() {
   const [error, setError]   = useState<string | null>(null);
   const selectedRef = useRef(selected);
   selectedRef.current = selected;
+  // Label snapshot of the last port list, so Refresh with nothing plugged in
+  // or removed leaves the <select> alone instead of rebuilding it.
+  const portsKeyRef = useRef('');
 
   const refreshPorts = useCallback(async () => {
     try {
       const list = await invoke<SerialPortInfo[]>('gps_list_ports');
+      const key = list.map(portLabel).join('\n');
+      if (key === portsKeyRef.current) return;
+      portsKeyRef.current = key;
       setPorts(list);
       // Default to the first USB port if nothing valid is selected yet.
       if (!list.some((p) => p.name === selectedRef.current)) {
@@ -5,7 +5,7 @@ import 'cesium/Build/Cesium/Widgets/widgets.css';
 
 import { CESIUM_ION_TOKEN, BEAM_HALF_ANGLE_DEG, BEAM_RANGE_M } from '../../config';
 import { useTelemetryStore } from '../../store/telemetryStore';
-import type { RocketTelemetry } from '../../types/telemetry';
+import type { AntennaState, MobileNode, RocketTelemetry } from '../../types/telemetry';
 import { formatFeet } from '../../utils/units';
 import styles from './TrajectoryMap.module.css';
 
@@ -168,6 +168,14 @@ export function TrajectoryMap() {
   // Change detection — only rebuild trajectory when history reference changes
   const lastHistoryRef   = useRef<RocketTelemetry[]>([]);
 
+  // Change detection for the per-frame primitives: preRender fires at the
+  // render rate, telemetry arrives at ~10 Hz, so most frames have nothing new.
+  const lastRocketRef    = useRef<RocketTelemetry | null>(null);
+  const lastRocketOffRef = useRef<number | null>(null);
+  const lastBeamAntRef   = useRef<AntennaState | null>(null);
+  const lastBeamNodeRef  = useRef<MobileNode | null>(null);
+  const lastBeamGsHRef   = useRef<number | null>(null);
+
   // Pad location + MSL altitude: captured from first GPS fix.
   const padAltRef        = useRef<number | null>(null);
   const padLatRef        = useRef<number | null>(null);
@@ -303,10 +311,14 @@ export function TrajectoryMap() {
         const rpp    = rocketPosPropRef.current;
         const rtp    = rocketTextPropRef.current;
         if (l && rocket && rpp && rtp && offset !== null && latestHasMapPosition) {
-          const displayAlt = clampToTerrainHeight(viewer, l.lon, l.lat, l.alt_m + offset);
-          const pos = Cesium.Cartesian3.fromDegrees(l.lon, l.lat, displayAlt, undefined, posScratch.current);
-          rpp.setValue(pos, Cesium.ReferenceFrame.FIXED);
-          rtp.setValue(formatFeet(l.alt_m));
+          if (l !== lastRocketRef.current || offset !== lastRocketOffRef.current) {
+            lastRocketRef.current    = l;
+            lastRocketOffRef.current = offset;
+            const displayAlt = clampToTerrainHeight(viewer, l.lon, l.lat, l.alt_m + offset);
+            const pos = Cesium.Cartesian3.fromDegrees(l.lon, l.lat, displayAlt, undefined, posScratch.current);
+            rpp.setValue(pos, Cesium.ReferenceFrame.FIXED);
+            rtp.setValue(formatFeet(l.alt_m));
+          }
           rocket.show = true;
           if (!trackedRef.current) {
             viewer.trackedEntity = rocket;
@@ -314,13 +326,17 @@ export function TrajectoryMap() {
           }
         } else if (rocket) {
           rocket.show = false;
+          lastRocketRef.current = null;
         }
 
         // Beam cone
         const bpls = beamPolylinesRef.current;
         if (!bpls.length || beamLinesRef.current?.isDestroyed()) return;
 
-        const hide = () => { for (const pl of bpls) pl.show = false; };
+        const hide = () => {
+          for (const pl of bpls) pl.show = false;
+          lastBeamAntRef.current = null;
+        };
         const gsNode = Object.values(ns)[0];
         if (!antenna || !gsNode) { hide(); return; }
 
@@ -328,6 +344,16 @@ export function TrajectoryMap() {
           Cesium.Cartographic.fromDegrees(gsNode.lon, gsNode.lat),
         );
         if (gsH === undefined) { hide(); return; }
+
+        // Assigning positions marks each polyline dirty and Cesium rebuilds
+        // its geometry, so only redraw the cone when an input moved.
+        if (antenna === lastBeamAntRef.current
+            && gsNode === lastBeamNodeRef.current
+            && gsH === lastBeamGsHRef.current) return;
+        lastBeamAntRef.current  = antenna;
+        lastBeamNodeRef.current = gsNode;
+        lastBeamGsHRef.current  = gsH;
+
         const gsEcef = Cesium.Cartesian3.fromDegrees(gsNode.lon, gsNode.lat, gsH);
         const { tip, ring } = coneRingPositions(
           gsEcef, antenna.actual_az, antenna.actual_el, BEAM_HALF_ANGLE_DEG, BEAM_RANGE_M,
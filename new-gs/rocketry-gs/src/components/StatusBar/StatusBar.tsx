@@ -1,5 +1,6 @@
 import { useEffect, useState, useCallback } from 'react';
-import { useTelemetryStore } from '../../store/telemetryStore';
+import { useShallow } from 'zustand/react/shallow';
+import { useTelemetryStore, type TelemetryState } from '../../store/telemetryStore';
 import type { AppTab } from '../../App';
 import { formatFeet } from '../../utils/units';
 import { phaseFromState, PHASE_LABEL, PHASE_COLOR } from '../../utils/flightPhase';
@@ -12,6 +13,36 @@ function formatElapsed(startMs: number): string {
   return `T+${String(m).padStart(2, '0')}:${String(ss).padStart(2, '0')}`;
 }
 
+// All four readouts are formatted inside one selector. useShallow compares
+// the resulting strings, so the metrics strip only re-renders when a value
+// that is actually displayed changes — not on every telemetry sample.
+const METRIC_LABELS = ['Altitude', 'Speed', 'RSSI', 'Antenna'] as const;
+
+function selectMetrics(s: TelemetryState): string[] {
+  const l = s.latest;
+  const a = s.antenna;
+  return [
+    formatFeet(l?.alt_m),
+    l ? `${Math.sqrt(l.vel_n ** 2 + l.vel_e ** 2 + l.vel_d ** 2).toFixed(1)} m/s` : '--',
+    l ? `${l.rssi} dBm` : '--',
+    a ? `${a.actual_az.toFixed(1)}° / ${a.actual_el.toFixed(1)}°` : '--',
+  ];
+}
+
+function StatusMetrics() {
+  const values = useTelemetryStore(useShallow(selectMetrics));
+  return (
+    <div className={styles.metrics}>
+      {METRIC_LABELS.map((label, i) => (
+        <div key={label} className={styles.metricBlock}>
+          <span className={styles.metric}>{label}</span>
+          <strong className={styles.value}>{values[i]}</strong>
+        </div>
+      ))}
+    </div>
+  );
+}
+
 interface Props {
   demo:         boolean;
   tab:          AppTab;
@@ -20,8 +51,7 @@ interface Props {
 }
 
 export function StatusBar({ demo, tab, onToggleDemo, onSetTab }: Props) {
-  const latest = useTelemetryStore((s) => s.latest);
-  const antenna = useTelemetryStore((s) => s.antenna);
+  const state = useTelemetryStore((s) => s.latest?.state);
   const connected = useTelemetryStore((s) => s.connected);
   const flightStart = useTelemetryStore((s) => s.flightStart);
   const clearFlight = useTelemetryStore((s) => s.clearFlight);
@@ -48,11 +78,7 @@ export function StatusBar({ demo, tab, onToggleDemo, onSetTab }: Props) {
     return () => clearInterval(id);
   }, [flightStart]);
 
-  const speed = latest
-    ? Math.sqrt(latest.vel_n ** 2 + latest.vel_e ** 2 + latest.vel_d ** 2).toFixed(1)
-    : '--';
-
-  const phase = phaseFromState(latest?.state);
+  const phase = phaseFromState(state);
 
   return (
     <div className={styles.bar}>
@@ -74,26 +100,7 @@ export function StatusBar({ demo, tab, onToggleDemo, onSetTab }: Props) {
         {connected ? 'Connected' : 'No link'}
       </div>
 
-      <div className={styles.metrics}>
-        <div className={styles.metricBlock}>
-          <span className={styles.metric}>Altitude</span>
-          <strong className={styles.value}>{formatFeet(latest?.alt_m)}</strong>
-        </div>
-        <div className={styles.metricBlock}>
-          <span className={styles.metric}>Speed</span>
-          <strong className={styles.value}>{speed !== '--' ? `${speed} m/s` : '--'}</strong>
-        </div>
-        <div className={styles.metricBlock}>
-          <span className={styles.metric}>RSSI</span>
-          <strong className={styles.value}>{latest ? `${latest.rssi} dBm` : '--'}</strong>
-        </div>
-        <div className={styles.metricBlock}>
-          <span className={styles.metric}>Antenna</span>
-          <strong className={styles.value}>
-            {antenna ? `${antenna.actual_az.toFixed(1)}° / ${antenna.actual_el.toFixed(1)}°` : '--'}
-          </strong>
-        </div>
-      </div>
+      <StatusMetrics />
 
       <span className={styles.spacer} />
 
@@ -50,6 +50,22 @@ function altProfile(t: number): number {
 // -- Chase-car offset from pad (degrees) ------------------------------------
 const CHASE_DLAT =  0.0012;
 const CHASE_DLON = -0.0008;
+const GS_LAT     = LAT0 + CHASE_DLAT;
+const GS_LON     = LON0 + CHASE_DLON;
+
+// -- Local flat-earth scale (constant for a session) -------------------------
+const DEG              = Math.PI / 180;
+const M_PER_DEG_LAT    = 111_320;
+const M_PER_DEG_LON    = M_PER_DEG_LAT * Math.cos(LAT0 * DEG);   // at the pad
+const M_PER_DEG_LON_GS = M_PER_DEG_LAT * Math.cos(GS_LAT * DEG); // at the GS node
+
+// Motor lag: exponential smoothing toward setpoint (~1.5 s time constant)
+const MOTOR_LAG_ALPHA = 1 - Math.exp(-DT / 1.5);
+
+// Seeded horizontal drift direction so the trajectory looks intentional
+const DRIFT_BEARING = 42; // degrees from north
+const DRIFT_COS     = Math.cos(DRIFT_BEARING * DEG);
+const DRIFT_SIN     = Math.sin(DRIFT_BEARING * DEG);
 
 // Firmware-style flight state across the demo timeline (matches codec
 // flight_state_name, mapped to display phases by flightPhase.ts).
@@ -63,6 +79,139 @@ function demoState(t: number): string {
   return 'LANDED';
 }
 
+// -- Precomputed flight profile ----------------------------------------------
+// Everything except motor lag and the separated-half quaternions is a
+// closed-form function of t, and the pad and GS node are fixed for the
+// session. One full cycle is therefore sampled at load, so the 10 Hz tick is
+// table lookups rather than re-evaluating altProfile, the attitude/apogee
+// curves and the drift, slant-range and az/el trig.
+const CYCLE_TICKS = CYCLE_S * HZ;
+const TARGET_APOGEE = 3000;
+
+interface FlightProfile {
+  alt:        Float64Array;
+  lat:        Float64Array;
+  lon:        Float64Array;
+  vel_n:      Float64Array;
+  vel_e:      Float64Array;
+  vel_d:      Float64Array;
+  pitch:      Float64Array;
+  roll:       Float64Array;
+  yaw:        Float64Array;
+  rssi:       Float64Array;
+  snr:        Float64Array;
+  predicted:  Float64Array;
+  deployment: Float64Array;
+  target_az:  Float64Array;
+  target_el:  Float64Array;
+  state:      string[];
+}
+
+function buildProfile(): FlightProfile {
+  const p: FlightProfile = {
+    alt:   new Float64Array(CYCLE_TICKS),
+    lat:   new Float64Array(CYCLE_TICKS),
+    lon:   new Float64Array(CYCLE_TICKS),
+    vel_n: new Float64Array(CYCLE_TICKS),
+    vel_e: new Float64Array(CYCLE_TICKS),
+    vel_d: new Float64Array(CYCLE_TICKS),
+    pitch:      new Float64Array(CYCLE_TICKS),
+    roll:       new Float64Array(CYCLE_TICKS),
+    yaw:        new Float64Array(CYCLE_TICKS),
+    rssi:       new Float64Array(CYCLE_TICKS),
+    snr:        new Float64Array(CYCLE_TICKS),
+    predicted:  new Float64Array(CYCLE_TICKS),
+    deployment: new Float64Array(CYCLE_TICKS),
+    target_az:  new Float64Array(CYCLE_TICKS),
+    target_el:  new Float64Array(CYCLE_TICKS),
+    state:      new Array<string>(CYCLE_TICKS),
+  };
+
+  for (let i = 0; i < CYCLE_TICKS; i++) {
+    const t = i * DT;
+
+    // -- Position -----------------------------------------------------------
+    const alt  = altProfile(t);
+    const frac = Math.min(t, 28) / 28;            // 0->1 over the flight
+
+    // Horizontal drift — monotonic so the trajectory is a true arc, not a loop.
+    // Rocket drifts ~700 m downrange by landing.
+    const downrange = 700 * frac;
+    const dlat = (downrange * DRIFT_COS) / M_PER_DEG_LAT;
+    const dlon = (downrange * DRIFT_SIN) / M_PER_DEG_LON;
+    const lat  = LAT0 + dlat;
+    const lon  = LON0 + dlon;
+
+    // -- Velocity (numerical derivative of alt + drift) ---------------------
+    const altNext = altProfile(Math.min(t + DT, 28));
+    const vel_d   = -(altNext - alt) / DT;                    // positive = falling
+
+    const fracNext  = Math.min(t + DT, 28) / 28;
+    const downNext  = 700 * fracNext;
+    const vel_horiz = (downNext - downrange) / DT;
+
+    // -- Signal -------------------------------------------------------------
+    const slantRange = Math.sqrt(
+      ((lat - LAT0) * M_PER_DEG_LAT) ** 2 +
+      ((lon - LON0) * M_PER_DEG_LON) ** 2 +
+      (alt - ALT0) ** 2,
+    );
+
+    // -- Attitude -----------------------------------------------------------
+    // During burn: pitched slightly toward drift; during descent: stable
+    const pitch = t < 3
+      ? 5 + 3 * Math.sin(t * 2)
+      : t < 14
+        ? 2 + 4 * Math.sin(t * 0.4)
+        : 1 * Math.sin(t * 0.2);
+
+    const roll = t < 14
+      ? 360 * (t / 14) * 0.5 + 8 * Math.sin(t * 1.3)  // slow spin
+      : 5 * Math.sin(t * 0.3);
+
+    const yaw = (DRIFT_BEARING + 5 * Math.sin(t * 0.7)) % 360;
+
+    // -- Active drag --------------------------------------------------------
+    const predicted = t < 3
+      ? 3250
+      : t < 14
+        ? 3180 - 160 * Math.min(1, (t - 3) / 11)
+        : MAX_ALT;
+    const deployment = t < 3
+      ? 0
+      : t < 12
+        ? Math.max(0, Math.min(70, ((predicted - TARGET_APOGEE) / 220) * 70))
+        : 0;
+
+    // -- Antenna target (az/el from GS node position, not pad) --------------
+    // The beam is drawn from the GS node, so angles must be referenced there.
+    const dx_m  = (lat - GS_LAT) * M_PER_DEG_LAT;
+    const dy_m  = (lon - GS_LON) * M_PER_DEG_LON_GS;
+    const horiz = Math.sqrt(dx_m ** 2 + dy_m ** 2);
+
+    p.alt[i]        = alt;
+    p.lat[i]        = lat;
+    p.lon[i]        = lon;
+    p.vel_n[i]      = vel_horiz * DRIFT_COS;
+    p.vel_e[i]      = vel_horiz * DRIFT_SIN;
+    p.vel_d[i]      = vel_d;
+    p.pitch[i]      = pitch;
+    p.roll[i]       = roll;
+    p.yaw[i]        = yaw;
+    p.rssi[i]       = Math.round(-60 - 20 * Math.log10(Math.max(1, slantRange / 100)));
+    p.snr[i]        = parseFloat((15 - slantRange / 500).toFixed(1));
+    p.predicted[i]  = predicted;
+    p.deployment[i] = deployment;
+    p.target_az[i]  = ((Math.atan2(dy_m, dx_m) / DEG) + 360) % 360;
+    p.target_el[i]  = Math.atan2(alt - ALT0, Math.max(1, horiz)) / DEG;
+    p.state[i]      = demoState(t);
+  }
+
+  return p;
+}
+
+const PROFILE = buildProfile();
+
 // Display-frame attitude of one separated half hanging under canopy: a gentle
 // pendulum swing + slow spin, optionally flipped nose-down. Each half is given a
 // different `seed` so the two transmitters report visibly independent motion.
@@ -81,10 +230,10 @@ function hangDisplayQuat(noseDown: boolean, t: number, seed: number): THREE.Quat
 }
 
 export function useDemoMode(enabled: boolean) {
-  const { addTelemetry, setTx, setAntenna, updateNode, setConnected, clearFlight } =
+  const { addTelemetry, setTxPair, setAntenna, updateNode, setConnected, clearFlight } =
     useTelemetryStore();
 
-  const tRef       = useRef(0);
+  const tickRef    = useRef(0);
   // Simulate motor lag: actual position lags behind setpoint with a ~1.5 s time constant.
   const actualAzRef = useRef(0);
   const actualElRef = useRef(0);
@@ -94,74 +243,41 @@ export function useDemoMode(enabled: boolean) {
 
     clearFlight();
     setConnected(true);
-    tRef.current = 0;
+    tickRef.current = 0;
     actualAzRef.current = 0;
     actualElRef.current = 0;
 
-    // Seeded horizontal drift direction so the trajectory looks intentional
-    const driftBearing = 42; // degrees from north
+    // -- Ground nodes -------------------------------------------------
+    // The chase car never moves in the demo, so publish it once. Rewriting it
+    // every tick hands TrajectoryMap a fresh `nodes` object and re-runs its
+    // node-entity slow path at 10 Hz for no visible change.
+    updateNode({
+      id:        'gs',
+      name:      'GS',
+      lat:       GS_LAT,
+      lon:       GS_LON,
+      timestamp: Date.now(),
+    });
 
     const id = setInterval(() => {
-      const t = tRef.current % CYCLE_S;
-      tRef.current += DT;
-
-      // -- Position -------------------------------------------------------
-      const alt  = altProfile(t);
-      const frac = Math.min(t, 28) / 28;            // 0->1 over the flight
-
-      // Horizontal drift — monotonic so the trajectory is a true arc, not a loop.
-      // Rocket drifts ~700 m downrange by landing.
-      const downrange = 700 * frac;
-      const bearRad   = (driftBearing * Math.PI) / 180;
-      const dlat = (downrange * Math.cos(bearRad)) / 111_320;
-      const dlon = (downrange * Math.sin(bearRad)) / (111_320 * Math.cos(LAT0 * Math.PI / 180));
-      const lat  = LAT0 + dlat;
-      const lon  = LON0 + dlon;
-
-      // -- Velocity (numerical derivative of alt + drift) --------------
-      const altNext = altProfile(Math.min(t + DT, 28));
-      const vel_d   = -(altNext - alt) / DT;                    // positive = falling
-
-      const fracNext = Math.min(t + DT, 28) / 28;
-      const downNext = 700 * fracNext;
-      const vel_horiz   = (downNext - downrange) / DT;
-      const vel_n       = vel_horiz * Math.cos(bearRad);
-      const vel_e       = vel_horiz * Math.sin(bearRad);
-
-      // -- Attitude ----------------------------------------------------
-      // During burn: pitched slightly toward drift; during descent: stable
-      const pitch = t < 3
-        ? 5 + 3 * Math.sin(t * 2)
-        : t < 14
-          ? 2 + 4 * Math.sin(t * 0.4)
-          : 1 * Math.sin(t * 0.2);
-
-      const roll = t < 14
-        ? 360 * (t / 14) * 0.5 + 8 * Math.sin(t * 1.3)  // slow spin
-        : 5 * Math.sin(t * 0.3);
-
-      const yaw = (driftBearing + 5 * Math.sin(t * 0.7)) % 360;
-
-      // -- Signal ------------------------------------------------------
-      const slantRange = Math.sqrt(
-        ((lat - LAT0) * 111_320) ** 2 +
-        ((lon - LON0) * 111_320 * Math.cos(LAT0 * Math.PI / 180)) ** 2 +
-        (alt - ALT0) ** 2,
-      );
-      const rssi = Math.round(-60 - 20 * Math.log10(Math.max(1, slantRange / 100)));
-      const snr  = parseFloat((15 - slantRange / 500).toFixed(1));
-      const targetApogee = 3000;
-      const predictedApogee = t < 3
-        ? 3250
-        : t < 14
-          ? 3180 - 160 * Math.min(1, (t - 3) / 11)
-          : MAX_ALT;
-      const deploymentPercent = t < 3
-        ? 0
-        : t < 12
-          ? Math.max(0, Math.min(70, ((predictedApogee - targetApogee) / 220) * 70))
-          : 0;
-      const flapAngleDeg = deploymentPercent * 0.6;
+      const i = tickRef.current % CYCLE_TICKS;
+      tickRef.current += 1;
+      const t = i * DT;
+
+      // -- Position / velocity / attitude / signal (precomputed) ---------
+      const alt   = PROFILE.alt[i];
+      const lat   = PROFILE.lat[i];
+      const lon   = PROFILE.lon[i];
+      const vel_n = PROFILE.vel_n[i];
+      const vel_e = PROFILE.vel_e[i];
+      const vel_d = PROFILE.vel_d[i];
+      const pitch = PROFILE.pitch[i];
+      const roll  = PROFILE.roll[i];
+      const yaw   = PROFILE.yaw[i];
+      const rssi  = PROFILE.rssi[i];
+      const snr   = PROFILE.snr[i];
+      const state = PROFILE.state[i];
+      const deploymentPercent = PROFILE.deployment[i];
 
       addTelemetry({
         timestamp: Date.now(),
@@ -169,77 +285,62 @@ export function useDemoMode(enabled: boolean) {
         vel_n, vel_e, vel_d,
         roll, pitch, yaw,
         rssi, snr,
-        flap_angle_deg: flapAngleDeg,
+        flap_angle_deg: deploymentPercent * 0.6,
         flap_deployment_percent: deploymentPercent,
-        predicted_apogee_m: predictedApogee,
-        target_apogee_m: targetApogee,
-        state: demoState(t),
+        predicted_apogee_m: PROFILE.predicted[i],
+        target_apogee_m: TARGET_APOGEE,
+        state,
       });
 
       // -- Onboard transmitters (915 on nose, 433 on ADS) -----------------
       // On ascent both radios ride the same airframe, so they report the same
       // attitude. After separation each half swings under its own canopy: the
       // nose section falls nose-down, the aft/ADS section motor-down (nose-up).
-      const state = demoState(t);
       const separated = state === 'DESCENT_DROGUE' || state === 'DESCENT_MAIN' || state === 'LANDED';
       const rocketQuat = new THREE.Quaternion().setFromEuler(new THREE.Euler(
-        (pitch * Math.PI) / 180, (yaw * Math.PI) / 180, (roll * Math.PI) / 180, 'XYZ',
+        pitch * DEG, yaw * DEG, roll * DEG, 'XYZ',
       ));
       const noseDisp = separated ? hangDisplayQuat(true,  t, 0.0) : rocketQuat;
       const adsDisp  = separated ? hangDisplayQuat(false, t, 2.3) : rocketQuat;
       const split = separated ? 0.00003 : 0; // ~3 m between the two halves once apart
 
-      setTx({
-        id: 'nose', freq_mhz: 915, timestamp: Date.now(),
-        quat: displayToNedQuat(noseDisp), have_gps: true,
-        lat: lat + split, lon: lon + split, alt_m: alt + (separated ? 6 : 0),
-        vel_n, vel_e, vel_d: vel_d + (separated ? -0.6 : 0),
-        rssi: rssi + 3, snr,
-      });
-      setTx({
-        id: 'ads', freq_mhz: 433, timestamp: Date.now(),
-        quat: displayToNedQuat(adsDisp), have_gps: true,
-        lat: lat - split, lon: lon - split, alt_m: alt - (separated ? 6 : 0),
-        vel_n, vel_e, vel_d: vel_d + (separated ? 0.6 : 0),
-        rssi: rssi - 2, snr: snr - 1,
-      });
+      const now = Date.now();
+      setTxPair(
+        {
+          id: 'nose', freq_mhz: 915, timestamp: now,
+          quat: displayToNedQuat(noseDisp), have_gps: true,
+          lat: lat + split, lon: lon + split, alt_m: alt + (separated ? 6 : 0),
+          vel_n, vel_e, vel_d: vel_d + (separated ? -0.6 : 0),
+          rssi: rssi + 3, snr,
+        },
+        {
+          id: 'ads', freq_mhz: 433, timestamp: now,
+          quat: displayToNedQuat(adsDisp), have_gps: true,
+          lat: lat - split, lon: lon - split, alt_m: alt - (separated ? 6 : 0),
+          vel_n, vel_e, vel_d: vel_d + (separated ? 0.6 : 0),
+          rssi: rssi - 2, snr: snr - 1,
+        },
+      );
+
+      // -- Antenna tracking (target precomputed, motor lag is stateful) ----
+      const az = PROFILE.target_az[i];
+      const el = PROFILE.target_el[i];
 
-      // -- Antenna tracking (az/el from GS node position, not pad) ---------
-      // The beam is drawn from the GS node, so angles must be referenced there.
-      const gsLat = LAT0 + CHASE_DLAT;
-      const gsLon = LON0 + CHASE_DLON;
-      const dx_m = (lat - gsLat) * 111_320;
-      const dy_m = (lon - gsLon) * 111_320 * Math.cos(gsLat * Math.PI / 180);
-      const horiz = Math.sqrt(dx_m ** 2 + dy_m ** 2);
-      const el    = Math.atan2(alt - ALT0, Math.max(1, horiz)) * (180 / Math.PI);
-      const az    = ((Math.atan2(dy_m, dx_m) * (180 / Math.PI)) + 360) % 360;
-
-      // Motor lag: exponential smoothing toward setpoint (~1.5 s time constant)
-      const ALPHA = 1 - Math.exp(-DT / 1.5);
-      actualAzRef.current += (az - actualAzRef.current) * ALPHA;
-      actualElRef.current += (el - actualElRef.current) * ALPHA;
+      actualAzRef.current += (az - actualAzRef.current) * MOTOR_LAG_ALPHA;
+      actualElRef.current += (el - actualElRef.current) * MOTOR_LAG_ALPHA;
 
       setAntenna({
-        timestamp: Date.now(),
+        timestamp: now,
         actual_az: actualAzRef.current,
         actual_el: actualElRef.current,
         target_az: az,
         target_el: el,
       });
-
-      // -- Ground nodes -------------------------------------------------
-      updateNode({
-        id:        'gs',
-        name:      'GS',
-        lat:       LAT0 + CHASE_DLAT,
-        lon:       LON0 + CHASE_DLON,
-        timestamp: Date.now(),
-      });
     }, 1000 / HZ);
 
     return () => {
       clearInterval(id);
       setConnected(false);
     };
-  }, [enabled, addTelemetry, setTx, setAntenna, updateNode, setConnected, clearFlight]);
+  }, [enabled, addTelemetry, setTxPair, setAntenna, updateNode, setConnected, clearFlight]);
 }
@@ -63,6 +63,7 @@ export interface TelemetryState {
 
   addTelemetry: (t: RocketTelemetry) => void;
   setTx:        (t: TxTelemetry) => void;
+  setTxPair:    (a: TxTelemetry, b: TxTelemetry) => void;
   setAntenna:   (a: AntennaState) => void;
   setGroundImu: (i: GroundImuState) => void;
   setAhrsStatus: (s: AhrsStatus) => void;
@@ -111,6 +112,9 @@ export const useTelemetryStore = create<TelemetryState>((set) => ({
 
   setTx: (t) => set((s) => ({ tx: { ...s.tx, [t.id]: t } })),
 
+  // Both transmitters in one update, so subscribers re-render once.
+  setTxPair: (a, b) => set((s) => ({ tx: { ...s.tx, [a.id]: a, [b.id]: b } })),
+
   setAntenna: (a) => set({ antenna: a }),
 
   setGroundImu: (i) =>
@@ -7,13 +7,20 @@
 
 #include <string.h>
 
+// Only the topic is cleared: strncpy NUL-pads it and the payload is bounded by
+// payload_len, so the 320-byte payload isn't zeroed again on every publish.
+static inline void mqtt_set_topic( MqttMessage& out, const char* topic )
+{
+    strncpy( out.topic, topic, sizeof(out.topic) - 1 );
+    out.topic[ sizeof(out.topic) - 1 ] = '\0';
+}
+
 static inline bool mqtt_encode_proto( MqttMessage& out,
                                       const char* topic,
                                       const pb_msgdesc_t* fields,
                                       const void* message )
 {
-    memset( &out, 0, sizeof(out) );
-    strncpy( out.topic, topic, sizeof(out.topic) - 1 );
+    mqtt_set_topic( out, topic );
 
     pb_ostream_t stream = pb_ostream_from_buffer( out.payload, sizeof(out.payload) );
     if ( !pb_encode( &stream, fields, message ) ) {
@@ -32,8 +39,7 @@ static inline bool mqtt_set_binary( MqttMessage& out,
 {
     if ( len > sizeof(out.payload) ) return false;
 
-    memset( &out, 0, sizeof(out) );
-    strncpy( out.topic, topic, sizeof(out.topic) - 1 );
+    mqtt_set_topic( out, topic );
     memcpy( out.payload, payload, len );
     out.payload_len = len;
     return true;
@@ -131,14 +131,46 @@ static void ms5611_calculate( uint32_t D1, uint32_t D2,
 
     int32_t P = (int32_t)( ( (int64_t)D1 * SENS / 2097152L - OFF ) / 32768L );
 
-    *temp_c      = TEMP / 100.0f;
-    *pressure_pa = P / 100.0f;
+    // Both outputs are in hundredths; scale by the reciprocal so every 50 Hz
+    // sample costs a VMUL rather than a VDIV.
+    *temp_c      = TEMP * 0.01f;
+    *pressure_pa = P * 0.01f;
 }
 
 // ISA altitude in metres MSL.  Pass actual QNH if known, else 101325 Pa.
+//
+// powf() with a fractional exponent costs an exp/log pair on every 50 Hz
+// sample.  The curve is tabulated once over p/QNH = 0.5 .. 1.1 (about -800 m
+// to 5500 m) and linearly interpolated; worst-case error is under 0.1 m,
+// below the MS5611's own noise.  Ratios outside the table fall back to powf().
+#define BARO_ISA_EXP        0.1902949f
+#define BARO_LUT_RATIO_MIN  0.5f
+#define BARO_LUT_RATIO_MAX  1.1f
+#define BARO_LUT_SIZE       129     // 128 intervals
+
+static constexpr float BARO_LUT_SCALE =
+    ( BARO_LUT_SIZE - 1 ) / ( BARO_LUT_RATIO_MAX - BARO_LUT_RATIO_MIN );
+
+static float s_alt_lut[ BARO_LUT_SIZE ];
+
+static void baro_altitude_lut_init()
+{
+    for ( int i = 0; i < BARO_LUT_SIZE; ++i ) {
+        const float ratio = BARO_LUT_RATIO_MIN + i / BARO_LUT_SCALE;
+        s_alt_lut[i] = 44330.0f * ( 1.0f - powf( ratio, BARO_ISA_EXP ) );
+    }
+}
+
 static float baro_altitude( float pressure_pa, float qnh_pa )
 {
-    return 44330.0f * ( 1.0f - powf( pressure_pa / qnh_pa, 0.1902949f ) );
+    const float ratio = pressure_pa / qnh_pa;
+    const float x     = ( ratio - BARO_LUT_RATIO_MIN ) * BARO_LUT_SCALE;
+    if ( !( x >= 0.0f && x < BARO_LUT_SIZE - 1 ) )     // also catches NaN
+        return 44330.0f * ( 1.0f - powf( ratio, BARO_ISA_EXP ) );
+
+    const int   i = (int)x;
+    const float f = x - (float)i;
+    return s_alt_lut[i] + f * ( s_alt_lut[i + 1] - s_alt_lut[i] );
 }
 
 // -----------------------------------------------------------------------------
@@ -152,6 +184,7 @@ static void baro_task( void* )
 {
     s_reply_q = xQueueCreateStatic( 1, sizeof(I2cResponse),
                                      s_reply_storage, &s_reply_buf );
+    baro_altitude_lut_init();
 
     vTaskDelay( pdMS_TO_TICKS(200) );
 
@@ -37,7 +37,7 @@ static radio::rf69::RF69 s_radio(
     Pins::LORA1_RST,
     s_lora1_cfg );
 
-static uint8_t diag_spi_read_reg( bool miso_pullup )
+static void diag_spi_setup()
 {
     spi_init( spi1, 1'000'000u );
     spi_set_format( spi1, 8, SPI_CPOL_0, SPI_CPHA_0, SPI_MSB_FIRST );
@@ -45,9 +45,6 @@ static uint8_t diag_spi_read_reg( bool miso_pullup )
     gpio_set_function( Pins::LORA1_MOSI, GPIO_FUNC_SPI );
     gpio_set_function( Pins::LORA1_MISO, GPIO_FUNC_SPI );
 
-    if ( miso_pullup ) gpio_pull_up( Pins::LORA1_MISO );
-    else               gpio_disable_pulls( Pins::LORA1_MISO );
-
     gpio_init( Pins::LORA1_NSS );
     gpio_set_dir( Pins::LORA1_NSS, GPIO_OUT );
     gpio_put( Pins::LORA1_NSS, 1 );
@@ -58,22 +55,30 @@ static uint8_t diag_spi_read_reg( bool miso_pullup )
     sleep_ms( 1 );
     gpio_put( Pins::LORA1_RST, 0 );
     sleep_ms( 10 );
+}
+
+static uint8_t diag_spi_read_reg( bool miso_pullup )
+{
+    if ( miso_pullup ) gpio_pull_up( Pins::LORA1_MISO );
+    else               gpio_disable_pulls( Pins::LORA1_MISO );
+    sleep_us( 50 );
 
     gpio_put( Pins::LORA1_NSS, 0 );
-    const uint8_t addr = 0x10u;
-    uint8_t val = 0xAAu;
-    spi_write_blocking( spi1, &addr, 1 );
-    spi_read_blocking( spi1, 0x00u, &val, 1 );
+    const uint8_t tx[ 2 ] = { 0x10u, 0x00u };
+    uint8_t       rx[ 2 ] = { 0xAAu, 0xAAu };
+    spi_write_read_blocking( spi1, tx, rx, 2 );
+    const uint8_t val = rx[ 1 ];
     gpio_put( Pins::LORA1_NSS, 1 );
 
-    gpio_disable_pulls( Pins::LORA1_MISO );
     return val;
 }
 
 static void diag_spi()
 {
+    diag_spi_setup();
     const uint8_t no_pull = diag_spi_read_reg( false );
     const uint8_t pullup  = diag_spi_read_reg( true );
+    gpio_disable_pulls( Pins::LORA1_MISO );
 
     log_print( "[lora1] RF69 SPI diag: RegVersion=0x%02X (pulled-up=0x%02X)\n",
                no_pull, pullup );
@@ -98,7 +103,7 @@ static void publish_hex_packet( const radio::Packet& pkt )
 {
     if ( !mqtt_is_connected() ) return;
 
-    MqttMessage m = {};
+    MqttMessage m;
     groundstation_Lora1Rf69Packet pb = groundstation_Lora1Rf69Packet_init_zero;
     pb.has_data = true;
     pb.data.size = pkt.len < sizeof(pb.data.bytes) ? pkt.len : sizeof(pb.data.bytes);
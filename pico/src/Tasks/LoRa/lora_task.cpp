@@ -101,7 +101,7 @@ static void publish_lora_sample( const groundstation_RocketLoRaSample& pb )
 {
     if ( !mqtt_is_connected() ) return;
 
-    MqttMessage m = {};
+    MqttMessage m;
     if ( mqtt_encode_proto( m, "rocket/lora0",
                             groundstation_RocketLoRaSample_fields, &pb ) )
         xQueueSend( g_mqtt_queue, &m, 0 );
@@ -274,7 +274,10 @@ static bool handle_legacy_sigma_packet( const radio::Packet& pkt )
     return true;
 }
 
-static uint8_t diag_spi_read_reg( bool miso_pullup )
+// The SPI bus and reset pulse are set up once; both MISO pull variants are
+// then read back-to-back rather than re-initialising and resetting the radio
+// for each read.
+static void diag_spi_setup()
 {
     spi_init( spi0, 1'000'000u );
     spi_set_format( spi0, 8, SPI_CPOL_0, SPI_CPHA_0, SPI_MSB_FIRST );
@@ -282,9 +285,6 @@ static uint8_t diag_spi_read_reg( bool miso_pullup )
     gpio_set_function( Pins::LORA0_MOSI, GPIO_FUNC_SPI );
     gpio_set_function( Pins::LORA0_MISO, GPIO_FUNC_SPI );
 
-    if ( miso_pullup ) gpio_pull_up( Pins::LORA0_MISO );
-    else               gpio_disable_pulls( Pins::LORA0_MISO );
-
     gpio_init( Pins::LORA0_NSS );
     gpio_set_dir( Pins::LORA0_NSS, GPIO_OUT );
     gpio_put( Pins::LORA0_NSS, 1 );
@@ -295,22 +295,32 @@ static uint8_t diag_spi_read_reg( bool miso_pullup )
     sleep_ms( 10 );
     gpio_put( Pins::LORA0_RST, 1 );
     sleep_ms( 10 );
+}
+
+static uint8_t diag_spi_read_reg( bool miso_pullup )
+{
+    if ( miso_pullup ) gpio_pull_up( Pins::LORA0_MISO );
+    else               gpio_disable_pulls( Pins::LORA0_MISO );
+    sleep_us( 50 );
 
     gpio_put( Pins::LORA0_NSS, 0 );
-    const uint8_t addr = 0x42u;
-    uint8_t val = 0xAAu;
-    spi_write_blocking( spi0, &addr, 1 );
-    spi_read_blocking( spi0, 0x00u, &val, 1 );
+    // Address and dummy byte clocked in one full-duplex transfer; the
+    // register value comes back in the second byte.
+    const uint8_t tx[ 2 ] = { 0x42u, 0x00u };
+    uint8_t       rx[ 2 ] = { 0xAAu, 0xAAu };
+    spi_write_read_blocking( spi0, tx, rx, 2 );
+    const uint8_t val = rx[ 1 ];
     gpio_put( Pins::LORA0_NSS, 1 );
 
-    gpio_disable_pulls( Pins::LORA0_MISO );
     return val;
 }
 
 static void diag_spi()
 {
+    diag_spi_setup();
     const uint8_t no_pull = diag_spi_read_reg( false );
     const uint8_t pullup  = diag_spi_read_reg( true );
+    gpio_disable_pulls( Pins::LORA0_MISO );
 
     log_print( "[lora0] SX1276 SPI diag: RegVersion=0x%02X (pulled-up=0x%02X)\n",
                no_pull, pullup );
@@ -14,20 +14,23 @@
 #include <stdlib.h>
 #include <string.h>
 #include <stdio.h>
+#include <math.h>
 
 static constexpr uint32_t kCalibrationAhrsMaxAgeMs = 500;
 
 static float wrap_180( float deg )
 {
-    while ( deg > 180.0f )   deg -= 360.0f;
-    while ( deg <= -180.0f ) deg += 360.0f;
+    deg = fmodf( deg, 360.0f );
+    if ( deg > 180.0f )        deg -= 360.0f;
+    else if ( deg <= -180.0f ) deg += 360.0f;
     return deg;
 }
 
 static float wrap_360( float deg )
 {
-    while ( deg < 0.0f )    deg += 360.0f;
-    while ( deg >= 360.0f ) deg -= 360.0f;
+    deg = fmodf( deg, 360.0f );
+    if ( deg < 0.0f )    deg += 360.0f;
+    if ( deg >= 360.0f ) deg -= 360.0f;
     return deg;
 }
 
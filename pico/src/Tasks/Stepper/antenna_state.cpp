@@ -10,6 +10,7 @@
 #include "pico/time.h"
 
 #include <string.h>
+#include <math.h>
 
 namespace StateCfg {
     static constexpr uint32_t PUBLISH_MS = 1000;
@@ -17,8 +18,9 @@ namespace StateCfg {
 
 static float wrap_360( float deg )
 {
-    while ( deg < 0.0f )    deg += 360.0f;
-    while ( deg >= 360.0f ) deg -= 360.0f;
+    deg = fmodf( deg, 360.0f );
+    if ( deg < 0.0f )    deg += 360.0f;
+    if ( deg >= 360.0f ) deg -= 360.0f;
     return deg;
 }
 
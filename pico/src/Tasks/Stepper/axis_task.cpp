@@ -28,15 +28,17 @@ namespace StepHw {
 
 static float wrap_360( float deg )
 {
-    while ( deg < 0.0f )    deg += 360.0f;
-    while ( deg >= 360.0f ) deg -= 360.0f;
+    deg = fmodf( deg, 360.0f );
+    if ( deg < 0.0f )    deg += 360.0f;
+    if ( deg >= 360.0f ) deg -= 360.0f;   // -tiny + 360 rounds up to 360
     return deg;
 }
 
 static float normalize_delta_180( float deg )
 {
-    while ( deg > 180.0f )   deg -= 360.0f;
-    while ( deg <= -180.0f ) deg += 360.0f;
+    deg = fmodf( deg, 360.0f );
+    if ( deg > 180.0f )        deg -= 360.0f;
+    else if ( deg <= -180.0f ) deg += 360.0f;
     return deg;
 }
 
@@ -2,6 +2,7 @@
 #include "hardware/gpio.h"
 #include "hardware/sync.h"
 #include "hardware/timer.h"
+#include "pico/platform.h"
 #include "pico/time.h"
 #include <math.h>
 
@@ -9,31 +10,38 @@ static constexpr uint32_t kDirSetupUs = 100;
 static constexpr uint32_t kStopIdleUs = 1000;
 static constexpr uint32_t kPulseLowUs = 5;
 
+// Same fmodf form as tracker_control.cpp: a +/-inf angle passed to set_angle()
+// can't hang the caller, though it comes back as NaN.
 static float wrap_360_local( float deg )
 {
-    while ( deg < 0.0f )    deg += 360.0f;
-    while ( deg >= 360.0f ) deg -= 360.0f;
+    deg = fmodf( deg, 360.0f );
+    if ( deg < 0.0f )    deg += 360.0f;
+    if ( deg >= 360.0f ) deg -= 360.0f;
     return deg;
 }
 
 static float normalize_delta_180( float deg )
 {
-    while ( deg > 180.0f )   deg -= 360.0f;
-    while ( deg <= -180.0f ) deg += 360.0f;
+    deg = fmodf( deg, 360.0f );
+    if ( deg > 180.0f )        deg -= 360.0f;
+    else if ( deg <= -180.0f ) deg += 360.0f;
     return deg;
 }
 
 // -----------------------------------------------------------------------------
 // Hardware timer ISR  –  runs in IRQ context, no FreeRTOS calls allowed
+//
+// Fires once per step (kHz at slew speed), so both the callback and the tick
+// are linked into SRAM: no XIP cache misses or stalls behind flash writes.
 // -----------------------------------------------------------------------------
 
-static bool step_isr_cb( repeating_timer_t* rt )
+static bool __not_in_flash_func( step_isr_cb )( repeating_timer_t* rt )
 {
     auto* d = static_cast<Cl57te*>( rt->user_data );
     return d->isr_tick();
 }
 
-bool Cl57te::isr_tick()
+bool __not_in_flash_func( Cl57te::isr_tick )()
 {
     if ( !timer_running_ ) return false;
 
@@ -99,6 +107,13 @@ void Cl57te::init( const Config& cfg )
                                  * motor_revs_per_output_rev;
     steps_per_deg_ = output_steps_per_rev / 360.0f;
 
+    // Cache the inverse and the step-rate limits too: angle_deg() and the
+    // timer start path run on every tracker update and would otherwise
+    // redo the same division / multiplies each time.
+    deg_per_step_    = 1.0f / steps_per_deg_;
+    default_step_hz_ = static_cast<uint32_t>( cfg_.default_speed_dps * steps_per_deg_ );
+    max_step_hz_     = static_cast<uint32_t>( cfg_.max_speed_dps * steps_per_deg_ );
+
     pos_steps_ = 0;
     target_steps_ = 0;
     active_step_sign_ = 0;
@@ -195,14 +210,9 @@ bool Cl57te::ensure_timer_running( uint32_t step_hz )
     if ( timer_running_ ) return true;
 
     // Choose step rate
-    if ( step_hz == 0 ) {
-        float dps = cfg_.default_speed_dps;
-        step_hz = static_cast<uint32_t>( dps * steps_per_deg_ );
-    }
-    if ( step_hz < 1 )        step_hz = 1;
-    float max_hz = cfg_.max_speed_dps * steps_per_deg_;
-    if ( step_hz > static_cast<uint32_t>( max_hz ) )
-        step_hz = static_cast<uint32_t>( max_hz );
+    if ( step_hz == 0 )            step_hz = default_step_hz_;
+    if ( step_hz < 1 )             step_hz = 1;
+    if ( step_hz > max_step_hz_ )  step_hz = max_step_hz_;
 
     int64_t period_us = -( static_cast<int64_t>( 1'000'000 ) / step_hz );
 
@@ -261,7 +271,7 @@ bool Cl57te::is_moving() const
 
 float Cl57te::angle_deg() const
 {
-    return static_cast<float>( pos_steps_ ) / steps_per_deg_;
+    return static_cast<float>( pos_steps_ ) * deg_per_step_;
 }
 
 float Cl57te::wrapped_angle_deg() const
@@ -110,6 +110,9 @@ private:
     volatile uint32_t dir_hold_until_us_ = 0;
 
     float    steps_per_deg_ = 1.0f;   // cached at init
+    float    deg_per_step_  = 1.0f;   // 1 / steps_per_deg_
+    uint32_t default_step_hz_ = 1;    // default_speed_dps in steps/s
+    uint32_t max_step_hz_     = 1;    // max_speed_dps in steps/s
 
     volatile bool     have_last_dir_level_ = false;
     volatile bool     last_dir_level_ = true;
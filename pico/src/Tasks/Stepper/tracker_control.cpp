@@ -2,8 +2,6 @@
 #include "tracker_state.hpp"
 #include "shared.hpp"
 
-#include "math_utils/GroundStationMath.h"
-
 #include "FreeRTOS.h"
 #include "task.h"
 #include "queue.h"
@@ -13,17 +11,22 @@
 
 static constexpr TickType_t kControlPeriodTicks = pdMS_TO_TICKS(20);
 
+// One fmodf plus a single fix-up instead of add/subtract loops: constant time
+// for any input, so a +/-inf angle can no longer hang the control loop. fmodf
+// turns inf into NaN, and a NaN angle passes through to the caller unchanged.
 static float wrap_360( float deg )
 {
-    while ( deg < 0.0f )    deg += 360.0f;
-    while ( deg >= 360.0f ) deg -= 360.0f;
+    deg = fmodf( deg, 360.0f );
+    if ( deg < 0.0f )    deg += 360.0f;
+    if ( deg >= 360.0f ) deg -= 360.0f;   // -tiny + 360 rounds up to 360
     return deg;
 }
 
 static float normalize_delta_180( float deg )
 {
-    while ( deg > 180.0f )   deg -= 360.0f;
-    while ( deg <= -180.0f ) deg += 360.0f;
+    deg = fmodf( deg, 360.0f );
+    if ( deg > 180.0f )        deg -= 360.0f;
+    else if ( deg <= -180.0f ) deg += 360.0f;
     return deg;
 }
 
@@ -41,6 +44,88 @@ static bool is_fresh( const LocationMsg& loc, uint64_t now_us, uint32_t timeout_
     return age_us <= (uint64_t)timeout_ms * 1000ull;
 }
 
+// -- Station-relative geometry -------------------------------------------------
+// The ground station sits still for a session while the rocket fix changes
+// every packet, so the station-side radians and trig (double precision, which
+// is software FP on the M33) are cached and only recomputed when the GS fix
+// moves. This replaces the out-of-tree math_utils (GroundStationMath) calls:
+//   distance  = 2R atan2(sqrt a, sqrt(1 - a)),
+//               a = sin^2(dlat/2) + cos lat1 cos lat2 sin^2(dlon/2)
+//   azimuth   = atan2(sin dlon cos lat2, cos lat1 sin lat2 - sin lat1 cos lat2 cos dlon)
+//   elevation = atan2(dalt, distance)
+// on a spherical earth of radius R, with the flat-earth shortcut below.
+static constexpr double kEarthRadiusM = 6371000.0;
+static constexpr double kDegToRad     = M_PI / 180.0;
+
+// Below this range a local equirectangular projection is used instead of the
+// great-circle solve; at the limit distance error is ~0.001 % and bearing
+// error ~0.2 deg at mid latitudes, well inside the antenna beamwidth.
+static constexpr double kFlatEarthMaxM = 50000.0;
+
+struct StationTrig {
+    double lat_deg = NAN;
+    double lon_deg = NAN;
+    double lat_rad = 0.0;
+    double lon_rad = 0.0;
+    double sin_lat = 0.0;
+    double cos_lat = 1.0;
+};
+
+static void station_trig_update( StationTrig* st, double lat_deg, double lon_deg )
+{
+    if ( lat_deg == st->lat_deg && lon_deg == st->lon_deg ) return;
+    st->lat_deg = lat_deg;
+    st->lon_deg = lon_deg;
+    st->lat_rad = lat_deg * kDegToRad;
+    st->lon_rad = lon_deg * kDegToRad;
+    st->sin_lat = sin( st->lat_rad );
+    st->cos_lat = cos( st->lat_rad );
+}
+
+struct StationVector {
+    double distance_m;
+    double azimuth_deg;
+    double elevation_deg;
+};
+
+// Distance, bearing and elevation in one pass. Tracking range is normally a
+// few km, so the flat-earth branch (cached station trig, one sqrt, no sin/cos)
+// is the common case; the haversine / initial-bearing solve only runs beyond
+// kFlatEarthMaxM, sharing the rocket latitude's sin/cos between terms.
+static StationVector station_solve( const StationTrig& st,
+                                    double lat_deg, double lon_deg, double dalt_m )
+{
+    const double lat2 = lat_deg * kDegToRad;
+    const double dlat = lat2 - st.lat_rad;
+    const double dlon = lon_deg * kDegToRad - st.lon_rad;
+
+    StationVector v;
+    // cos(mid-latitude) from the cached station trig, first order in dlat/2:
+    // the dropped term is ~1e-5 relative at kFlatEarthMaxM.
+    const double cos_mid = st.cos_lat - st.sin_lat * ( dlat * 0.5 );
+    const double x = dlon * cos_mid;                           // east, rad
+    const double y = dlat;                                     // north, rad
+    v.distance_m = kEarthRadiusM * sqrt( x * x + y * y );
+    if ( v.distance_m < kFlatEarthMaxM ) {
+        v.azimuth_deg   = atan2( x, y ) / kDegToRad;
+        v.elevation_deg = atan2( dalt_m, v.distance_m ) / kDegToRad;
+        return v;
+    }
+
+    const double sin_lat2 = sin( lat2 );
+    const double cos_lat2 = cos( lat2 );
+
+    const double s_dlat = sin( dlat * 0.5 );
+    const double s_dlon = sin( dlon * 0.5 );
+    const double a = s_dlat * s_dlat + st.cos_lat * cos_lat2 * s_dlon * s_dlon;
+
+    v.distance_m    = 2.0 * kEarthRadiusM * atan2( sqrt( a ), sqrt( 1.0 - a ) );
+    v.azimuth_deg   = atan2( sin( dlon ) * cos_lat2,
+                             st.cos_lat * sin_lat2 - st.sin_lat * cos_lat2 * cos( dlon ) ) / kDegToRad;
+    v.elevation_deg = atan2( dalt_m, v.distance_m ) / kDegToRad;
+    return v;
+}
+
 static void publish_stop()
 {
     StepperCmd stop = {};
@@ -358,6 +443,7 @@ static void stepper_ctrl_task( void* )
     float altitude_pid_integral = 0.0f;
     float altitude_pid_last_error = 0.0f;
     bool altitude_pid_have_last_error = false;
+    StationTrig station_trig;
 
     for ( ;; ) {
         const uint64_t now_us = time_us_64();
@@ -462,19 +548,14 @@ static void stepper_ctrl_task( void* )
         }
 
         if ( mode == TrackerMode::Auto && gs_fresh && target_fresh ) {
-            rocket_math::Location station{ gs.lat, gs.lon, gs.alt_m };
-            rocket_math::Location rocket{ rkt.lat, rkt.lon, rkt.alt_m };
-            const double distance =
-                rocket_math::GroundStationMath::haversineDistance( station, rocket );
-            status.distance_m = (float)distance;
-
-            if ( distance >= cfg.distance_min_m ) {
-                float desired_az = wrap_360( (float)
-                    rocket_math::GroundStationMath::calculateAzimuth( station, rocket )
-                    + cfg.yaw_trim_deg );
-                float desired_el = clamp_float( (float)
-                    rocket_math::GroundStationMath::calculateElevation( station, rocket )
-                    + cfg.el_trim_deg,
+            station_trig_update( &station_trig, gs.lat, gs.lon );
+            const StationVector v =
+                station_solve( station_trig, rkt.lat, rkt.lon, rkt.alt_m - gs.alt_m );
+            status.distance_m = (float)v.distance_m;
+
+            if ( v.distance_m >= cfg.distance_min_m ) {
+                float desired_az = wrap_360( (float)v.azimuth_deg + cfg.yaw_trim_deg );
+                float desired_el = clamp_float( (float)v.elevation_deg + cfg.el_trim_deg,
                     cfg.el_min_deg,
                     cfg.el_max_deg );
                 float cmd_az = desired_az;
@@ -113,19 +113,35 @@ static void cmd_altitude( float alt_m,
     printf( "altitude: %.2f m MSL\n", (double)alt_m );
 }
 
+// ALT,<alt_m>[,<boot_ms>[,<rssi>[,<snr>]]] arrives from the bridge at up to
+// 10 Hz, so walk it once with strtof/strtoul and step over each comma instead
+// of running sscanf's format interpreter.  Missing trailing fields stay 0.
 static bool dispatch_alt_line( const char* line )
 {
     if ( strncmp( line, "ALT,", 4 ) != 0 ) return false;
 
-    float alt_m = 0.0f;
+    const char* p   = line + 4;
+    char*       end = nullptr;
+
+    const float alt_m = strtof( p, &end );
+    if ( end == p ) {
+        printf( "bad ALT line\n" );
+        return true;
+    }
+
     unsigned long boot_ms = 0;
     float rssi = 0.0f;
     float snr = 0.0f;
-    const int count = sscanf( line + 4, "%f,%lu,%f,%f",
-                              &alt_m, &boot_ms, &rssi, &snr );
-    if ( count < 1 ) {
-        printf( "bad ALT line\n" );
-        return true;
+    if ( *end == ',' ) {
+        p = end + 1;
+        boot_ms = strtoul( p, &end, 10 );
+        if ( end != p && *end == ',' ) {
+            p = end + 1;
+            rssi = strtof( p, &end );
+            if ( end != p && *end == ',' ) {
+                snr = strtof( end + 1, nullptr );
+            }
+        }
     }
 
     cmd_altitude( alt_m, (uint32_t)boot_ms, rssi, snr );
@@ -288,8 +304,12 @@ static void usb_task( void* )
         }
 
         // -- 2. Read characters from USB CDC ------------------------------
+        // Echo goes into the stdio buffer and is flushed once per drained
+        // burst rather than per character; a bridged ALT line lands as a
+        // few dozen characters at once.
         {
-            int c;
+            int  c;
+            bool echoed = false;
             while ( ( c = getchar_timeout_us( 0 ) ) != PICO_ERROR_TIMEOUT && c < 256 ) {
                 if ( c == '\r' || c == '\n' ) {
                     printf( "\r\n" );
@@ -298,19 +318,20 @@ static void usb_task( void* )
                     line_len  = 0;
                     line[ 0 ] = '\0';
                     printf( "# " );
-                    stdio_flush();
+                    echoed = true;
 
                 } else if ( ( c == '\b' || c == 127 ) && line_len > 0 ) {
                     line[ --line_len ] = '\0';
                     printf( "\b \b" );
-                    stdio_flush();
+                    echoed = true;
 
                 } else if ( c >= 0x20 && line_len < sizeof( line ) - 1 ) {
                     line[ line_len++ ] = ( char ) c;
                     stdio_putchar( c );
-                    stdio_flush();
+                    echoed = true;
                 }
             }
+            if ( echoed ) stdio_flush();
         }
     }
 }
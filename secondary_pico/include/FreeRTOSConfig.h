@@ -31,7 +31,7 @@ extern "C" {
 /* Scheduler */
 #define configUSE_PREEMPTION                    1
 #define configUSE_TICKLESS_IDLE                 0
-#define configUSE_IDLE_HOOK                     0
+#define configUSE_IDLE_HOOK                     1
 #define configUSE_TICK_HOOK                     0
 #define configTICK_RATE_HZ                      ( ( TickType_t ) 1000 )
 #define configMAX_PRIORITIES                    32
@@ -90,7 +90,7 @@ extern "C" {
 #define configTICK_CORE                         0
 #define configRUN_MULTIPLE_PRIORITIES           1
 #define configUSE_CORE_AFFINITY                 1
-#define configUSE_PASSIVE_IDLE_HOOK             0
+#define configUSE_PASSIVE_IDLE_HOOK             1
 
 /* Pico SDK interop */
 #define configSUPPORT_PICO_SYNC_INTEROP         1
@@ -80,23 +80,26 @@ static void usb_task( void* )
             }
         }
 
+        // Echo is flushed once per drained burst, not once per character.
         {
-            int c;
+            int  c;
+            bool echoed = false;
             while ( (c = getchar_timeout_us(0)) != PICO_ERROR_TIMEOUT && c < 256 ) {
                 if ( c == '\r' || c == '\n' ) {
                     printf( "\r\n" );
                     line[ line_len ] = '\0';
                     dispatch( line, line_len );
                     line_len = 0; line[0] = '\0';
-                    printf( "# " ); stdio_flush();
+                    printf( "# " ); echoed = true;
                 } else if ( (c == '\b' || c == 127) && line_len > 0 ) {
                     line[ --line_len ] = '\0';
-                    printf( "\b \b" ); stdio_flush();
+                    printf( "\b \b" ); echoed = true;
                 } else if ( c >= 0x20 && line_len < sizeof(line) - 1 ) {
                     line[ line_len++ ] = (char)c;
-                    stdio_putchar(c); stdio_flush();
+                    stdio_putchar(c); echoed = true;
                 }
             }
+            if ( echoed ) stdio_flush();
         }
     }
 }
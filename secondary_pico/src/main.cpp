@@ -23,6 +23,7 @@
 #include "Tasks/USB/usb_task.hpp"
 
 #include "pico/stdlib.h"
+#include "hardware/sync.h"
 #include <stdio.h>
 
 // -- Shared FreeRTOS handles ---------------------------------------------------
@@ -77,6 +78,20 @@ void vApplicationGetTimerTaskMemory( StaticTask_t** ppxTimerTaskTCBBuffer,
     *pulTimerTaskStackSize   =  configTIMER_TASK_STACK_DEPTH;
 }
 
+// -- Idle hooks ----------------------------------------------------------------
+// Between packets both cores have nothing to run. Gate the core clock with WFI
+// rather than spinning in the idle loop; the 1 kHz tick, the USB IRQ and the
+// SMP cross-core yield all wake it, so no scheduling latency is added.
+void vApplicationIdleHook( void )
+{
+    __wfi();
+}
+
+void vApplicationPassiveIdleHook( void )
+{
+    __wfi();
+}
+
 } // extern "C"
 
 // -- Entry point ---------------------------------------------------------------
@@ -11,9 +11,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import queue
+import re
 import select
 import socket
 import sys
+import threading
 import time
 
 try:
@@ -22,6 +25,9 @@ try:
 except ImportError as exc:
     raise SystemExit("Install pyserial first: python3 -m pip install pyserial") from exc
 
+READ_CHUNK = 4096
+GUI_QUEUE_DEPTH = 32
+
 
 def list_serial_ports() -> None:
     ports = list(list_ports.comports())
@@ -42,6 +48,24 @@ def decode_line(raw: bytes) -> str:
     return raw.decode("utf-8", errors="replace").strip()
 
 
+def read_lines(port: serial.Serial, pending: bytearray) -> list[str]:
+    """Drain whatever the port has buffered and return the complete lines.
+
+    The port is opened with timeout=0, so one read() returns everything that is
+    already waiting. A trailing partial line stays in ``pending`` until its
+    newline arrives.
+    """
+    pending += port.read(READ_CHUNK)
+    end = pending.rfind(b"\n")
+    if end < 0:
+        if len(pending) > READ_CHUNK:
+            pending.clear()
+        return []
+    complete = bytes(pending[:end])
+    del pending[: end + 1]
+    return [decode_line(raw) for raw in complete.split(b"\n")]
+
+
 def write_line(port: serial.Serial, text: str) -> None:
     port.write((text.rstrip("\r\n") + "\n").encode("ascii", errors="replace"))
     port.flush()
@@ -64,40 +88,96 @@ def mqtt_utf8(text: str) -> bytes:
     return len(data).to_bytes(2, "big") + data
 
 
-def mqtt_publish(host: str, port: int, topic: str, payload: str) -> None:
-    client_id = f"usb-alt-bridge-{int(time.time())}"
+MQTT_DISCONNECT = bytes([0xE0, 0x00])
+
+
+def mqtt_connect_packet(client_id: str) -> bytes:
     variable = mqtt_utf8("MQTT") + bytes([4, 2]) + (30).to_bytes(2, "big")
     packet = variable + mqtt_utf8(client_id)
-    connect = bytes([0x10]) + mqtt_remaining_length(len(packet)) + packet
+    return bytes([0x10]) + mqtt_remaining_length(len(packet)) + packet
+
 
-    topic_bytes = mqtt_utf8(topic)
-    payload_bytes = payload.encode("utf-8")
-    publish_packet = topic_bytes + payload_bytes
-    publish = bytes([0x30]) + mqtt_remaining_length(len(publish_packet)) + publish_packet
+def mqtt_publish(host: str, port: int, connect: bytes, publish: bytes | bytearray) -> None:
+    """Send a prebuilt CONNECT, wait for CONNACK, then send ``publish``.
 
+    ``publish`` should end with MQTT_DISCONNECT so the PUBLISH and DISCONNECT
+    go out in a single write.
+    """
     with socket.create_connection((host, port), timeout=0.5) as sock:
         sock.sendall(connect)
         ack = sock.recv(4)
         if len(ack) < 4 or ack[0] != 0x20 or ack[3] != 0:
             raise OSError(f"MQTT CONNACK failed: {ack!r}")
         sock.sendall(publish)
-        sock.sendall(bytes([0xE0, 0x00]))
+
+
+_NUMBER = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+# Each optional field may be empty, but a field that is present must be numeric.
+_ALT_RE = re.compile(
+    rf"ALT,({_NUMBER})(?:,({_NUMBER})?)?(?:,({_NUMBER})?)?(?:,({_NUMBER})?)?"
+)
 
 
 def parse_alt_line(text: str) -> tuple[float, int, float | None, float | None] | None:
-    if not text.startswith("ALT,"):
-        return None
-    parts = text.split(",")
-    if len(parts) < 2:
+    match = _ALT_RE.fullmatch(text)
+    if not match:
         return None
-    alt_m = float(parts[1])
-    boot_ms = int(float(parts[2])) if len(parts) > 2 and parts[2] else 0
-    rssi = float(parts[3]) if len(parts) > 3 and parts[3] else None
-    snr = float(parts[4]) if len(parts) > 4 and parts[4] else None
-    return alt_m, boot_ms, rssi, snr
+    alt, boot, rssi, snr = match.groups()
+    return (
+        float(alt),
+        int(float(boot)) if boot else 0,
+        float(rssi) if rssi else None,
+        float(snr) if snr else None,
+    )
+
+
+class GuiPublisher:
+    """Publish GUI telemetry from a background thread.
+
+    mqtt_publish() connects and waits for CONNACK, so calling it inline would
+    stall the serial loop for a broker round trip on every ALT line. submit()
+    only queues the serialised payload and returns.
+
+    The CONNECT packet and encoded topic never change, so they are built once;
+    each PUBLISH is assembled into the same bytearray.
+    """
 
+    TOPIC = "rocket/telemetry"
 
-def publish_altitude_to_gui(host: str, port: int, text: str, lat: float, lon: float) -> None:
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self._connect = mqtt_connect_packet(f"usb-alt-bridge-{int(time.time())}")
+        self._topic = mqtt_utf8(self.TOPIC)
+        self._frame = bytearray()
+        self._queue: queue.Queue[str] = queue.Queue(maxsize=GUI_QUEUE_DEPTH)
+        threading.Thread(target=self._run, name="gui-publish", daemon=True).start()
+
+    def submit(self, payload: str) -> bool:
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            return False
+        return True
+
+    def _run(self) -> None:
+        while True:
+            body = self._queue.get().encode("utf-8")
+            frame = self._frame
+            frame.clear()
+            frame.append(0x30)
+            frame += mqtt_remaining_length(len(self._topic) + len(body))
+            frame += self._topic
+            frame += body
+            frame += MQTT_DISCONNECT
+            try:
+                mqtt_publish(self.host, self.port, self._connect, frame)
+                print(f"gui: published {self.TOPIC}")
+            except OSError as error:
+                print(f"gui: MQTT publish failed: {error}")
+
+
+def publish_altitude_to_gui(gui: GuiPublisher, text: str, lat: float, lon: float) -> None:
     parsed = parse_alt_line(text)
     if not parsed:
         return
@@ -120,7 +200,8 @@ def publish_altitude_to_gui(host: str, port: int, text: str, lat: float, lon: fl
     }
     payload["rssi"] = rssi if rssi is not None else 0
     payload["snr"] = snr if snr is not None else 0
-    mqtt_publish(host, port, "rocket/telemetry", json.dumps(payload, separators=(",", ":")))
+    if not gui.submit(json.dumps(payload, separators=(",", ":"))):
+        print("gui: publish queue full, sample dropped")
 
 
 def is_primary_noise(text: str) -> bool:
@@ -144,6 +225,7 @@ def bridge(
     lat: float,
     lon: float,
 ) -> int:
+    gui = GuiPublisher(mqtt_host, mqtt_port) if mqtt_enabled else None
     with open_port(secondary, baud) as sec, open_port(primary, baud) as pri:
         print(f"Forwarding ALT lines: {secondary} -> {primary} @ {baud}")
         if mqtt_enabled:
@@ -154,27 +236,25 @@ def bridge(
         print("Type primary commands like: status, base 880 1000, arm, auto")
         print("Bridge commands: /quit")
         print("Press Ctrl-C to stop.")
+        sec_pending = bytearray()
+        pri_pending = bytearray()
         while True:
             readable, _, _ = select.select([sec, pri, sys.stdin], [], [], 0.1)
 
             if sec in readable:
-                text = decode_line(sec.readline())
-                if text:
+                for text in read_lines(sec, sec_pending):
+                    if not text:
+                        continue
                     print(f"secondary: {text}")
                     if text.startswith("ALT,"):
                         write_line(pri, text)
                         print(f"forwarded: {text}")
-                        if mqtt_enabled:
-                            try:
-                                publish_altitude_to_gui(mqtt_host, mqtt_port, text, lat, lon)
-                                print("gui: published rocket/telemetry")
-                            except OSError as error:
-                                print(f"gui: MQTT publish failed: {error}")
+                        if gui:
+                            publish_altitude_to_gui(gui, text, lat, lon)
 
             if pri in readable:
-                text = decode_line(pri.readline())
-                if text:
-                    if show_primary_noise or not is_primary_noise(text):
+                for text in read_lines(pri, pri_pending):
+                    if text and (show_primary_noise or not is_primary_noise(text)):
                         print(f"primary: {text}")
 
             if sys.stdin in readable:
@@ -186,12 +266,8 @@ def bridge(
                     return 0
                 if text:
                     write_line(pri, text)
-                    if text.startswith("ALT,") and mqtt_enabled:
-                        try:
-                            publish_altitude_to_gui(mqtt_host, mqtt_port, text, lat, lon)
-                            print("gui: published rocket/telemetry")
-                        except OSError as error:
-                            print(f"gui: MQTT publish failed: {error}")
+                    if text.startswith("ALT,") and gui:
+                        publish_altitude_to_gui(gui, text, lat, lon)
 
 
 def main(argv: list[str]) -> int: